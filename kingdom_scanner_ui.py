@@ -49,7 +49,7 @@ from roktracker.utils.adb import get_bluestacks_port
 from roktracker.utils.exception_handling import GuiExceptionHandler
 from roktracker.utils.validator import validate_installation, sanitize_scanname
 from threading import Thread
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any
 
 from roktracker.utils.database import HistoricalDatabase
 from roktracker.utils.analytics import KingdomAnalytics
@@ -448,9 +448,13 @@ class BasicOptionsFrame(QFrame):
             logger.error(f"Error getting port: {str(e)}")
             self.adb_port_text.setText("")
 
-    def get_options(self):
+    def get_formats(self) -> OutputFormats:
         formats = OutputFormats()
         formats.from_dict(self.output_options.get())
+        return formats
+
+    def get_options(self):
+        formats = self.get_formats()
         return {
             "uuid": self.scan_uuid_var.text(),
             "name": self.scan_name_text.text(),
@@ -679,11 +683,13 @@ class LastGovernorInfo(QFrame):
                 self.additional_stats.set_var(key, value)
 
 class AnalyticsTab(QWidget):
-    def __init__(self, db: HistoricalDatabase):
+    def __init__(self, db: HistoricalDatabase, get_formats: Callable[[], OutputFormats] | None = None,
+                 excel_backend: str = "xlsxwriter"):
         super().__init__()
         self.db = db
+        self.get_formats = get_formats
         self.analytics = KingdomAnalytics(self.db)
-        self.exporter = AnalyticsExporter(self.db, self.analytics)
+        self.exporter = AnalyticsExporter(self.db, self.analytics, excel_backend)
         
         main_layout = QVBoxLayout()
         self.setLayout(main_layout)
@@ -1189,24 +1195,26 @@ class AnalyticsTab(QWidget):
                 for label in self.summary_labels.values():
                     label.setText("No data")
 
+            plots = self.analytics.create_all_trend_plots()
+
             if self.power_canvas is not None:
                 self.power_layout.removeWidget(self.power_canvas)
                 self.power_canvas.deleteLater()
-            self.power_canvas = self.analytics.create_advanced_power_trend_plot()
+            self.power_canvas = plots['power']
             if self.power_canvas:
                 self.power_layout.addWidget(self.power_canvas)
 
             if self.kp_canvas is not None:
                 self.kp_layout.removeWidget(self.kp_canvas)
                 self.kp_canvas.deleteLater()
-            self.kp_canvas = self.analytics.create_advanced_killpoints_trend_plot()
+            self.kp_canvas = plots['killpoints']
             if self.kp_canvas:
                 self.kp_layout.addWidget(self.kp_canvas)
 
             if self.kills_canvas is not None:
                 self.kills_layout.removeWidget(self.kills_canvas)
                 self.kills_canvas.deleteLater()
-            self.kills_canvas = self.analytics.create_t4t5_kills_trend_plot()
+            self.kills_canvas = plots['t4t5_kills']
             if self.kills_canvas:
                 self.kills_layout.addWidget(self.kills_canvas)
 
@@ -1224,7 +1232,8 @@ class AnalyticsTab(QWidget):
         try:
             output_dir = Path(get_app_root()) / "reports"
             output_dir.mkdir(exist_ok=True)
-            filename = self.exporter.export_kingdom_report(output_dir)
+            formats = self.get_formats() if self.get_formats else None
+            filename = self.exporter.export_kingdom_report(output_dir, formats)
             QMessageBox.information(self, "Success", f"Kingdom report exported to:\n{filename}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to export kingdom report:\n{str(e)}")
@@ -1377,7 +1386,11 @@ class App(QMainWindow):
 
         tabs.addTab(scanner_widget, "Scanner")
         
-        analytics_tab = AnalyticsTab(self.db)
+        analytics_tab = AnalyticsTab(
+            self.db,
+            self.options_frame.get_formats,
+            self.config["scan"].get("excel_backend", "xlsxwriter"),
+        )
         tabs.addTab(analytics_tab, "Analytics")
 
         self.load_preferences()
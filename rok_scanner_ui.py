@@ -567,7 +567,12 @@ class ScannerTab(QWidget):
 
     def governor_callback(self, gov_data, extra_data):
         """Update progress and governor info"""
-        if hasattr(self.info_frame, 'set'):
+        if hasattr(self.info_frame, 'update_batch') and extra_data is not None:
+            # Called on the scanner thread, the batch is applied in _update_ui
+            app = self.window()
+            if isinstance(app, UnifiedScannerApp):
+                app.update_ui_signal.emit({"batch": (self, gov_data, extra_data)})
+        elif hasattr(self.info_frame, 'set'):
             self.info_frame.set(gov_data)
         
         if extra_data and hasattr(extra_data, 'current') and hasattr(extra_data, 'total'):
@@ -761,6 +766,11 @@ class UnifiedScannerApp(QMainWindow):
         """Handle UI updates in a thread-safe way"""
         if not self.tabs:
             return
+
+        if "batch" in data:
+            tab, gov_data, extra_data = data["batch"]
+            tab.info_frame.update_batch(gov_data, extra_data)
+            return
             
         current_tab = self.tabs.currentWidget()
         if isinstance(current_tab, ScannerTab):
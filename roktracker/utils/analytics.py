@@ -4,65 +4,76 @@ import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from datetime import datetime, timedelta
-from scipy import stats
-from scipy.signal import savgol_filter
-from statsmodels.tsa.seasonal import seasonal_decompose
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
-from sklearn.preprocessing import StandardScaler
-from sklearn.covariance import EllipticEnvelope
 from .database import HistoricalDatabase
 
 class KingdomAnalytics:
     def __init__(self, db: HistoricalDatabase):
         self.db = db
+        # days -> ((db revision, day), trends df, parsed scan dates, seconds since first scan)
+        self._trends_cache = {}
 
-    def create_power_trend_plot(self):
-        df = self.db.get_kingdom_trends(days=30)
+    def _get_trends(self, days=30):
+        """Fetch kingdom trends with their parsed scan dates, cached until the database or day changes"""
+        version = (self.db.revision, datetime.now().date())
+        cached = self._trends_cache.get(days)
+        if cached is not None and cached[0] == version:
+            return cached[1:]
+
+        df = self.db.get_kingdom_trends(days=days)
+        dates = pd.to_datetime(df['scan_date'], format='ISO8601')
+        date_nums = (dates - dates.min()).dt.total_seconds().to_numpy()
+        self._trends_cache[days] = (version, df, dates, date_nums)
+        return df, dates, date_nums
+
+    def _create_trend_plot(self, dates, values, title, ylabel, color=None):
         fig = Figure(figsize=(8, 4))
         ax = fig.add_subplot(111)
         
-        if len(df) > 0:
-            ax.plot(pd.to_datetime(df['scan_date']), df['avg_power'] / 1_000_000, marker='o')
+        if len(values) > 0:
+            ax.plot(dates, values / 1_000_000, marker='o', color=color)
         
-        ax.set_title('Average Governor Power Trend')
+        ax.set_title(title)
         ax.set_xlabel('Date')
-        ax.set_ylabel('Average Power (Million)')
+        ax.set_ylabel(ylabel)
         ax.grid(True)
         fig.autofmt_xdate()
         
         return FigureCanvasQTAgg(fig)
 
+    def create_power_trend_plot(self):
+        df, dates, _ = self._get_trends(30)
+        return self._create_trend_plot(
+            dates, df['avg_power'].to_numpy(),
+            'Average Governor Power Trend', 'Average Power (Million)'
+        )
+
     def create_killpoints_trend_plot(self):
-        df = self.db.get_kingdom_trends(days=30)
-        fig = Figure(figsize=(8, 4))
-        ax = fig.add_subplot(111)
-        
-        if len(df) > 0:
-            ax.plot(pd.to_datetime(df['scan_date']), df['avg_killpoints'] / 1_000_000, marker='o', color='red')
-        
-        ax.set_title('Average Kill Points Trend')
-        ax.set_xlabel('Date')
-        ax.set_ylabel('Average Kill Points (Million)')
-        ax.grid(True)
-        fig.autofmt_xdate()
-        
-        return FigureCanvasQTAgg(fig)
+        df, dates, _ = self._get_trends(30)
+        return self._create_trend_plot(
+            dates, df['avg_killpoints'].to_numpy(),
+            'Average Kill Points Trend', 'Average Kill Points (Million)', 'red'
+        )
 
     def create_t4t5_kills_trend_plot(self):
-        df = self.db.get_kingdom_trends(days=30)
-        fig = Figure(figsize=(8, 4))
-        ax = fig.add_subplot(111)
-        
-        if len(df) > 0:
-            ax.plot(pd.to_datetime(df['scan_date']), df['total_t4t5_kills'] / 1_000_000, marker='o', color='purple')
-        
-        ax.set_title('Total T4/T5 Kills Trend')
-        ax.set_xlabel('Date')
-        ax.set_ylabel('Total T4/T5 Kills (Million)')
-        ax.grid(True)
-        fig.autofmt_xdate()
-        
-        return FigureCanvasQTAgg(fig)
+        df, dates, _ = self._get_trends(30)
+        return self._create_trend_plot(
+            dates, df['total_t4t5_kills'].to_numpy(),
+            'Total T4/T5 Kills Trend', 'Total T4/T5 Kills (Million)', 'purple'
+        )
+
+    def create_all_trend_plots(self):
+        """Builds the dashboard's power, kill points and T4/T5 kills trend plots from a single trends fetch"""
+        df, dates, _ = self._get_trends(30)
+
+        # The advanced plots reuse the trends cached by the fetch above
+        return {
+            'power': self.create_advanced_power_trend_plot(),
+            'killpoints': self.create_advanced_killpoints_trend_plot(),
+            't4t5_kills': self._create_trend_plot(
+                dates, df['total_t4t5_kills'].to_numpy(),
+                'Total T4/T5 Kills Trend', 'Total T4/T5 Kills (Million)', 'purple'
+            ),
+        }
 
     def create_alliance_power_distribution(self):
         df = self.db.get_alliance_statistics()
@@ -96,7 +107,7 @@ class KingdomAnalytics:
 
     def get_kingdom_summary(self):
         """Returns a dictionary with key kingdom statistics"""
-        df_trends = self.db.get_kingdom_trends(days=30)
+        df_trends, _, _ = self._get_trends(30)
         df_alliances = self.db.get_alliance_statistics()
         
         if len(df_trends) > 1:  # Need at least 2 data points
@@ -138,7 +149,7 @@ class KingdomAnalytics:
         
         power_growth = latest['power'] - first['power']
         kp_growth = latest['killpoints'] - first['killpoints']
-        days = (pd.to_datetime(latest['scan_date']) - pd.to_datetime(first['scan_date'])).days
+        days = (pd.to_datetime(latest['scan_date'], format='ISO8601') - pd.to_datetime(first['scan_date'], format='ISO8601')).days
         
         return {
             'name': latest['name'],
@@ -162,7 +173,7 @@ class KingdomAnalytics:
         for gov_id, color in zip(governor_ids, colors[:len(governor_ids)]):
             df = self.db.get_governor_history(gov_id)
             if len(df) > 0:
-                dates = pd.to_datetime(df['scan_date'])
+                dates = pd.to_datetime(df['scan_date'], format='ISO8601')
                 power_ax.plot(dates, df['power'] / 1_000_000, marker='o', color=color, label=df.iloc[-1]['name'])
                 kp_ax.plot(dates, df['killpoints'] / 1_000_000, marker='o', color=color, label=df.iloc[-1]['name'])
         
@@ -182,16 +193,20 @@ class KingdomAnalytics:
         fig.tight_layout()
         return FigureCanvasQTAgg(fig)
 
-    def predict_governor_growth(self, governor_id, days_to_predict=30):
+    def predict_governor_growth(self, governor_id, days_to_predict=30, history=None):
         """Predicts future power and kill points growth using linear regression"""
-        df = self.db.get_governor_history(governor_id)
+        # scipy is only needed here, keep it out of the module import
+        from scipy import stats
+
+        df = self.db.get_governor_history(governor_id) if history is None else history
         if len(df) < 3:  # Need at least 3 points for meaningful prediction
             return None
-            
-        df['date_num'] = (pd.to_datetime(df['scan_date']) - pd.to_datetime(df['scan_date'].iloc[0])).dt.total_seconds()
-        
+
+        scan_dates = pd.to_datetime(df['scan_date'], format='ISO8601')
+        date_num = (scan_dates - scan_dates.iloc[0]).dt.total_seconds()
+
         # Convert to numpy arrays and ensure float type
-        x = df['date_num'].to_numpy(dtype=np.float64)
+        x = date_num.to_numpy(dtype=np.float64)
         y_power = df['power'].to_numpy(dtype=np.float64)
         y_kp = df['killpoints'].to_numpy(dtype=np.float64)
         
@@ -200,9 +215,9 @@ class KingdomAnalytics:
         kp_slope, kp_intercept, kp_r, _, _ = np.array(stats.linregress(x, y_kp), dtype=np.float64)
         
         # Generate future dates
-        last_date = pd.to_datetime(df['scan_date'].iloc[-1])
+        last_date = scan_dates.iloc[-1]
         future_dates = pd.date_range(last_date, periods=days_to_predict+1, freq='D')[1:]
-        future_seconds = np.array((future_dates - pd.to_datetime(df['scan_date'].iloc[0])).total_seconds(), dtype=np.float64)
+        future_seconds = np.array((future_dates - scan_dates.iloc[0]).total_seconds(), dtype=np.float64)
         
         # Calculate predictions using numpy operations
         power_pred = power_slope * future_seconds + power_intercept
@@ -221,7 +236,7 @@ class KingdomAnalytics:
     def create_governor_prediction_plot(self, governor_id, days_to_predict=30):
         """Creates plots showing historical data and future predictions"""
         df = self.db.get_governor_history(governor_id)
-        predictions = self.predict_governor_growth(governor_id, days_to_predict)
+        predictions = self.predict_governor_growth(governor_id, days_to_predict, history=df)
         
         if predictions is None:
             return None
@@ -231,7 +246,7 @@ class KingdomAnalytics:
         kp_ax = fig.add_subplot(122)
         
         # Plot historical data
-        dates = pd.to_datetime(df['scan_date'])
+        dates = pd.to_datetime(df['scan_date'], format='ISO8601')
         power_ax.plot(dates, df['power'] / 1_000_000, 'o-', label='Historical', color='blue')
         kp_ax.plot(dates, df['killpoints'] / 1_000_000, 'o-', label='Historical', color='blue')
         
@@ -268,7 +283,7 @@ class KingdomAnalytics:
                 
             first = df.iloc[0]
             latest = df.iloc[-1]
-            days = (pd.to_datetime(latest['scan_date']) - pd.to_datetime(first['scan_date'])).days
+            days = (pd.to_datetime(latest['scan_date'], format='ISO8601') - pd.to_datetime(first['scan_date'], format='ISO8601')).days
             
             if days == 0:  # Avoid division by zero
                 continue
@@ -307,28 +322,54 @@ class KingdomAnalytics:
             return series
         
         if seasons:
+            from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
             model = ExponentialSmoothing(
                 series,
                 seasonal_periods=seasons,
                 trend='add',
                 seasonal='add'
             )
-        else:
-            model = ExponentialSmoothing(
-                series,
-                trend='add'
-            )
-        
-        return model.fit().fittedvalues
+            return model.fit().fittedvalues
+
+        return pd.Series(self._holt_linear(series.to_numpy(dtype=np.float64)), index=series.index)
+
+    def _holt_linear(self, y, alpha=0.5, beta=0.1):
+        """Holt's linear trend method with fixed smoothing factors, returns one-step-ahead fitted values"""
+        fitted = np.empty_like(y)
+        level = y[0]
+        trend = y[1] - y[0]
+        fitted[0] = y[0]
+        for t in range(1, len(y)):
+            fitted[t] = level + trend
+            prev_level = level
+            level = alpha * y[t] + (1 - alpha) * (level + trend)
+            trend = beta * (level - prev_level) + (1 - beta) * trend
+        return fitted
 
     def _fit_polynomial(self, x, y, degree=2):
-        """Fit polynomial regression of specified degree"""
-        coeffs = np.polyfit(x, y, degree)
-        poly = np.poly1d(coeffs)
-        return poly, coeffs
+        """Fit polynomial regression of specified degree, highest power first"""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if degree != 2:
+            return np.polyfit(x, y, degree)
+
+        # Solve the 3x3 normal equations directly instead of going through lstsq.
+        # x is scaled to [0, 1] first, raw seconds would make X.T @ X ill-conditioned.
+        scale = np.abs(x).max() or 1.0
+        t = x / scale
+        X = np.stack([t * t, t, np.ones_like(t)], axis=1)
+        try:
+            a, b, c = np.linalg.solve(X.T @ X, X.T @ y)
+        except np.linalg.LinAlgError:
+            return np.polyfit(x, y, degree)
+        return np.array([a / (scale * scale), b / scale, c])
 
     def _detect_anomalies(self, data, contamination=0.1):
         """Detect anomalies using Elliptic Envelope"""
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.covariance import EllipticEnvelope
+
         scaler = StandardScaler()
         data_scaled = scaler.fit_transform(data.reshape(-1, 1))
         outlier_detector = EllipticEnvelope(contamination=contamination, random_state=42)
@@ -337,24 +378,24 @@ class KingdomAnalytics:
 
     def analyze_power_trends(self, days=30):
         """Advanced power trend analysis with multiple statistical methods"""
-        df = self.db.get_kingdom_trends(days=days)
+        df, dates, date_nums = self._get_trends(days)
         if len(df) < 3:
             return None
 
-        dates = pd.to_datetime(df['scan_date'])
         power_values = df['avg_power'].values
-        date_nums = (dates - dates.min()).dt.total_seconds()
 
         # Calculate various trends
         ma_trend = self._calculate_moving_average(df['avg_power'])
         exp_smooth = self._calculate_exp_smoothing(df['avg_power'])
         
         # Polynomial regression
-        poly, coeffs = self._fit_polynomial(date_nums, power_values)
-        poly_trend = poly(date_nums)
+        coeffs = self._fit_polynomial(date_nums, power_values)
+        poly_trend = np.polyval(coeffs, date_nums)
 
         # Time series decomposition (if enough data points)
         if len(df) >= 14:  # Need reasonable number of points for decomposition
+            from statsmodels.tsa.seasonal import seasonal_decompose
+
             try:
                 decomposition = seasonal_decompose(
                     df['avg_power'], 
@@ -393,24 +434,24 @@ class KingdomAnalytics:
 
     def analyze_killpoints_trends(self, days=30):
         """Advanced kill points trend analysis with multiple statistical methods"""
-        df = self.db.get_kingdom_trends(days=days)
+        df, dates, date_nums = self._get_trends(days)
         if len(df) < 3:
             return None
 
-        dates = pd.to_datetime(df['scan_date'])
         kp_values = df['avg_killpoints'].values
-        date_nums = (dates - dates.min()).dt.total_seconds()
 
         # Calculate various trends
         ma_trend = self._calculate_moving_average(df['avg_killpoints'])
         exp_smooth = self._calculate_exp_smoothing(df['avg_killpoints'])
         
         # Polynomial regression
-        poly, coeffs = self._fit_polynomial(date_nums, kp_values)
-        poly_trend = poly(date_nums)
+        coeffs = self._fit_polynomial(date_nums, kp_values)
+        poly_trend = np.polyval(coeffs, date_nums)
 
         # Time series decomposition (if enough data points)
         if len(df) >= 14:
+            from statsmodels.tsa.seasonal import seasonal_decompose
+
             try:
                 decomposition = seasonal_decompose(
                     df['avg_killpoints'], 
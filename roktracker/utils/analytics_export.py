@@ -1,129 +1,161 @@
+import importlib.util
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
-import xlsxwriter
-from xlsxwriter.workbook import Workbook 
-from xlsxwriter.worksheet import Worksheet
-from xlsxwriter.chart_area import ChartArea
-from xlsxwriter.chart_line import ChartLine
-from xlsxwriter.format import Format as XlsxFormat
-from xlsxwriter.chartsheet import Chartsheet
-from typing import Optional, Union, cast, Any
+from typing import TYPE_CHECKING, Optional, cast, Any
 from .database import HistoricalDatabase
 from .analytics import KingdomAnalytics
+from .output_formats import OutputFormats
+
+if TYPE_CHECKING:
+    # xlsxwriter itself is only imported once an export runs
+    from xlsxwriter.workbook import Workbook
+    from xlsxwriter.worksheet import Worksheet
+    from xlsxwriter.chart_line import ChartLine
+    from xlsxwriter.format import Format as XlsxFormat
+
+
+def parquet_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
 
 class AnalyticsExporter:
-    def __init__(self, db: HistoricalDatabase, analytics: KingdomAnalytics):
+    HEADER_SPEC = {
+        'bold': True,
+        'align': 'center',
+        'valign': 'vcenter',
+        'bg_color': '#4472C4',
+        'font_color': 'white',
+        'border': 1
+    }
+    CELL_SPEC = {
+        'align': 'right',
+        'border': 1
+    }
+    DATE_SPEC = {
+        'align': 'center',
+        'border': 1,
+        'num_format': 'yyyy-mm-dd'
+    }
+
+    def __init__(self, db: HistoricalDatabase, analytics: KingdomAnalytics, excel_backend: str = 'xlsxwriter'):
         self.db = db
         self.analytics = analytics
+        # 'xlsxwriter' (default), 'pyaccelsx' for the kingdom report or 'xlsxlite' for the
+        # governor report. The optional writers drop charts and most formatting.
+        self.excel_backend = excel_backend
 
-    def export_kingdom_report(self, output_path: str | Path):
+    def export_kingdom_report(self, output_path: str | Path, formats: Optional[OutputFormats] = None):
         """Exports comprehensive kingdom analytics to Excel with multiple sheets"""
+        # Without xlsx selected the tables are written as parquet and Excel is skipped
+        if formats is not None and not formats.xlsx and parquet_available():
+            return self.export_kingdom_report_parquet(output_path)
+
         output_path = Path(output_path)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = output_path / f"kingdom_analytics_{timestamp}.xlsx"
 
-        workbook = xlsxwriter.Workbook(str(filename))
-        
-        try:
-            # Create format styles
-            header_format = workbook.add_format({
-                'bold': True,
-                'align': 'center',
-                'valign': 'vcenter',
-                'bg_color': '#4472C4',
-                'font_color': 'white',
-                'border': 1
-            })
-            
-            cell_format = workbook.add_format({
-                'align': 'right',
-                'border': 1
-            })
-            
-            date_format = workbook.add_format({
-                'align': 'center',
-                'border': 1,
-                'num_format': 'yyyy-mm-dd'
-            })
+        df_trends, df_alliances = self.db.get_kingdom_overview(days=30)
+        summary = self.analytics.get_kingdom_summary()
+        df_summary = pd.DataFrame([summary]) if summary else None
+
+        # Rust backed writer, only when configured since it has no trends chart,
+        # autofilter or date format
+        if self.excel_backend == 'pyaccelsx':
+            # Optional backends are only imported once they are asked for
+            from .analytics_export_fast import export_kingdom_report_fast, fast_backend_available
+            if fast_backend_available():
+                return export_kingdom_report_fast(filename, df_trends, df_alliances, df_summary)
+
+        # pandas emits the cells column by column, so this (small) report is written
+        # without constant_memory. Sheet formatting is applied after to_excel.
+        with pd.ExcelWriter(filename, engine='xlsxwriter', datetime_format='yyyy-mm-dd') as writer:
+            workbook = cast("Workbook", writer.book)
+
+            header_format, cell_format, date_format = self._install_formats(workbook)
 
             # Kingdom trends
-            df_trends = self.db.get_kingdom_trends(days=30)
             if not df_trends.empty:
-                worksheet = workbook.add_worksheet('Kingdom Trends')
-                self._write_dataframe(worksheet, df_trends, header_format, cell_format, date_format)
+                df_trends.to_excel(writer, sheet_name='Kingdom Trends', index=False)
+                worksheet = writer.sheets['Kingdom Trends']
+                self._format_sheet(worksheet, df_trends, header_format, cell_format, date_format)
                 self._add_trends_chart(workbook, worksheet, df_trends, 'Kingdom Trends Chart')
 
             # Alliance statistics
-            df_alliances = self.db.get_alliance_statistics()
             if not df_alliances.empty:
-                worksheet = workbook.add_worksheet('Alliance Statistics')
-                self._write_dataframe(worksheet, df_alliances, header_format, cell_format)
+                df_alliances.to_excel(writer, sheet_name='Alliance Statistics', index=False)
+                worksheet = writer.sheets['Alliance Statistics']
+                self._format_sheet(worksheet, df_alliances, header_format, cell_format)
 
             # Kingdom summary
-            summary = self.analytics.get_kingdom_summary()
-            if summary:
-                df_summary = pd.DataFrame([summary])
-                worksheet = workbook.add_worksheet('Kingdom Summary')
-                self._write_dataframe(worksheet, df_summary, header_format, cell_format)
-
-        finally:
-            workbook.close()
+            if df_summary is not None:
+                df_summary.to_excel(writer, sheet_name='Kingdom Summary', index=False)
+                worksheet = writer.sheets['Kingdom Summary']
+                self._format_sheet(worksheet, df_summary, header_format, cell_format)
 
         return filename
 
+    def export_kingdom_report_parquet(self, output_path: str | Path):
+        """Exports the kingdom analytics tables as parquet files into a timestamped directory"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        directory = Path(output_path) / f"kingdom_analytics_{timestamp}"
+        directory.mkdir(parents=True, exist_ok=True)
+
+        df_trends, df_alliances = self.db.get_kingdom_overview(days=30)
+        summary = self.analytics.get_kingdom_summary()
+
+        df_trends.to_parquet(directory / "kingdom_trends.parquet", engine='pyarrow', compression='zstd', index=False)
+        df_alliances.to_parquet(directory / "alliance_statistics.parquet", engine='pyarrow', compression='zstd', index=False)
+        if summary:
+            pd.DataFrame([summary]).to_parquet(
+                directory / "kingdom_summary.parquet", engine='pyarrow', compression='zstd', index=False
+            )
+
+        return directory
+
     def export_governor_report(self, governor_ids: list[str], output_path: str | Path):
         """Exports detailed governor comparison data"""
         output_path = Path(output_path)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = output_path / f"governor_comparison_{timestamp}.xlsx"
 
-        workbook = xlsxwriter.Workbook(str(filename))
+        # Historical data for all governors in a single query
+        df_history = self.db.get_governors_history(governor_ids)
+
+        # Growth predictions, reusing the history loaded above
+        histories = dict(tuple(df_history.groupby('governor_id', sort=False)))
+        predictions = []
+        for gov_id in governor_ids:
+            history = histories.get(gov_id)
+            if history is None:
+                continue
+            pred = self.analytics.predict_governor_growth(gov_id, history=history)
+            if pred:
+                predictions.append(pd.DataFrame(pred))
+        df_predictions = pd.concat(predictions, ignore_index=True) if predictions else None
+
+        # Streaming writer for very large histories, charts and formatting are dropped
+        if self.excel_backend == 'xlsxlite':
+            from .xlsxlite_backend import export_governor_report_xlsxlite, xlsxlite_available
+            if xlsxlite_available():
+                return export_governor_report_xlsxlite(filename, df_history, df_predictions)
+
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(
+            str(filename),
+            {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd'}
+        )
         
         try:
-            # Create format styles
-            header_format = workbook.add_format({
-                'bold': True,
-                'align': 'center',
-                'valign': 'vcenter',
-                'bg_color': '#4472C4',
-                'font_color': 'white',
-                'border': 1
-            })
-            
-            cell_format = workbook.add_format({
-                'align': 'right',
-                'border': 1
-            })
-            
-            date_format = workbook.add_format({
-                'align': 'center',
-                'border': 1,
-                'num_format': 'yyyy-mm-dd'
-            })
-
-            # Historical data for each governor
-            all_history = []
-            for gov_id in governor_ids:
-                history = self.db.get_governor_history(gov_id)
-                if not history.empty:
-                    all_history.append(history)
-
-            if all_history:
-                df_combined = pd.concat(all_history, ignore_index=True)
+            header_format, cell_format, date_format = self._install_formats(workbook)
+
+            if not df_history.empty:
                 worksheet = workbook.add_worksheet('Governor History')
-                self._write_dataframe(worksheet, df_combined, header_format, cell_format, date_format)
-                self._add_governor_charts(workbook, worksheet, df_combined, 'Governor Trends')
-
-            # Growth predictions
-            predictions = []
-            for gov_id in governor_ids:
-                pred = self.analytics.predict_governor_growth(gov_id)
-                if pred:
-                    predictions.append(pd.DataFrame(pred))
-
-            if predictions:
-                df_predictions = pd.concat(predictions, ignore_index=True)
+                self._write_dataframe(worksheet, df_history, header_format, cell_format, date_format)
+                self._add_governor_charts(workbook, worksheet, df_history, 'Governor Trends')
+
+            if df_predictions is not None:
                 worksheet = workbook.add_worksheet('Growth Predictions')
                 self._write_dataframe(worksheet, df_predictions, header_format, cell_format, date_format)
 
@@ -132,30 +164,49 @@ class AnalyticsExporter:
 
         return filename
 
-    def _write_dataframe(self, worksheet: Worksheet, df: pd.DataFrame, 
-                        header_format: XlsxFormat, cell_format: XlsxFormat,
-                        date_format: Optional[XlsxFormat] = None) -> None:
+    def _install_formats(self, workbook: "Workbook") -> "tuple[XlsxFormat, XlsxFormat, XlsxFormat]":
+        """Register the header, cell and date formats in a new workbook"""
+        return (
+            workbook.add_format(self.HEADER_SPEC),
+            workbook.add_format(self.CELL_SPEC),
+            workbook.add_format(self.DATE_SPEC),
+        )
+
+    def _write_dataframe(self, worksheet: "Worksheet", df: pd.DataFrame,
+                        header_format: "XlsxFormat", cell_format: "XlsxFormat",
+                        date_format: Optional["XlsxFormat"] = None) -> None:
         """Write pandas DataFrame to Excel worksheet with formatting"""
-        # Write headers
-        for col_num, value in enumerate(df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
-            
-        # Write data and set column widths
+        # Workbooks use constant_memory mode, which flushes every row once the next
+        # one is started. Sheet settings go first and cells are written row by row.
+        column_formats = self._format_sheet(worksheet, df, header_format, cell_format, date_format)
+
+        # Split the columns into runs sharing a format so each run is one write_row call
+        segments = []
+        start = 0
+        for idx in range(1, len(column_formats) + 1):
+            if idx == len(column_formats) or column_formats[idx] is not column_formats[start]:
+                segments.append((start, idx, column_formats[start]))
+                start = idx
+
+        # Write data with appropriate format
+        values = df.to_numpy(dtype=object)
+        for row, row_values in enumerate(values, start=1):
+            for first, last, cell_fmt in segments:
+                worksheet.write_row(row, first, row_values[first:last].tolist(), cell_fmt)
+
+    def _format_sheet(self, worksheet: "Worksheet", df: pd.DataFrame,
+                      header_format: "XlsxFormat", cell_format: "XlsxFormat",
+                      date_format: Optional["XlsxFormat"] = None) -> "list[XlsxFormat]":
+        """Set column widths and formats, filters, frozen header and header row, returns the column formats"""
+        column_formats = []
         for idx, col in enumerate(df.columns):
-            # Get max length for column width
-            max_length = max(
-                df[col].astype(str).apply(len).max(),
-                len(str(col))
-            ) + 2
-            worksheet.set_column(idx, idx, min(max_length, 50))  # Cap width at 50
-            
-            # Write data with appropriate format
             if 'date' in col.lower() and date_format is not None:
-                for row in range(len(df)):
-                    worksheet.write(row + 1, idx, df[col].iloc[row], date_format)
+                column_formats.append(date_format)
             else:
-                for row in range(len(df)):
-                    worksheet.write(row + 1, idx, df[col].iloc[row], cell_format)
+                column_formats.append(cell_format)
+
+            max_length = self._column_width(df[col], col)
+            worksheet.set_column(idx, idx, min(max_length, 50), column_formats[idx])  # Cap width at 50
 
         # Add filters
         worksheet.autofilter(0, 0, len(df), len(df.columns) - 1)
@@ -163,29 +214,54 @@ class AnalyticsExporter:
         # Freeze the top row
         worksheet.freeze_panes(1, 0)
 
-    def _add_trends_chart(self, workbook: Workbook, worksheet: Worksheet, 
+        # Write headers
+        for col_num, value in enumerate(df.columns.values):
+            worksheet.write(0, col_num, value, header_format)
+
+        return column_formats
+
+    def _column_width(self, series: pd.Series, name) -> int:
+        """Width needed for the longest value or the header of a column"""
+        longest = 0
+        if pd.api.types.is_integer_dtype(series):
+            # Only the extremes matter for integers, no need for a string copy of the column
+            lowest, highest = series.min(), series.max()
+            if not pd.isna(highest):
+                longest = max(len(str(int(lowest))), len(str(int(highest))))
+        elif not series.empty:
+            longest = int(series.astype(str).str.len().max())
+        return max(longest, len(str(name))) + 2
+
+    def _add_trends_chart(self, workbook: "Workbook", worksheet: "Worksheet",
                          df: pd.DataFrame, chart_name: str) -> None:
         """Add kingdom trends chart to a new worksheet"""
+        # A single point does not make a trend line
+        if len(df) < 2:
+            return
+
         chartsheet = cast(Any, workbook.add_chartsheet(chart_name))
         if chartsheet is None:
             return
             
-        chart = cast(ChartLine, workbook.add_chart({'type': 'line'}))
+        chart = cast("ChartLine", workbook.add_chart({'type': 'line'}))
         if chart is None:
             return
         
         # Add data series
         metrics = ['avg_power', 'avg_killpoints', 'total_t4t5_kills']
         colors = ['#4472C4', '#ED7D31', '#A5A5A5']
+        col_idx = {col: i for i, col in enumerate(df.columns)}
+        scan_date_idx = col_idx['scan_date']
+        nrows = len(df)
+        sheet_name = worksheet.name
         
-        for idx, (metric, color) in enumerate(zip(metrics, colors)):
-            if metric in df.columns:
+        for metric, color in zip(metrics, colors):
+            if metric in col_idx:
+                metric_idx = col_idx[metric]
                 chart.add_series({
                     'name': metric,
-                    'categories': [worksheet.name, 1, df.columns.get_loc('scan_date'), 
-                                len(df), df.columns.get_loc('scan_date')],
-                    'values': [worksheet.name, 1, df.columns.get_loc(metric), 
-                            len(df), df.columns.get_loc(metric)],
+                    'categories': [sheet_name, 1, scan_date_idx, nrows, scan_date_idx],
+                    'values': [sheet_name, 1, metric_idx, nrows, metric_idx],
                     'line': {'color': color, 'width': 2}
                 })
         
@@ -197,30 +273,37 @@ class AnalyticsExporter:
         if hasattr(chartsheet, 'set_chart'):
             chartsheet.set_chart(chart)
 
-    def _add_governor_charts(self, workbook: Workbook, worksheet: Worksheet, 
+    def _add_governor_charts(self, workbook: "Workbook", worksheet: "Worksheet",
                            df: pd.DataFrame, chart_name: str) -> None:
         """Add governor comparison charts to a new worksheet"""
+        # A single point does not make a trend line
+        if len(df) < 2:
+            return
+
         chartsheet = cast(Any, workbook.add_chartsheet(chart_name))
         if chartsheet is None:
             return
             
-        chart = cast(ChartLine, workbook.add_chart({'type': 'line'}))
+        chart = cast("ChartLine", workbook.add_chart({'type': 'line'}))
         if chart is None:
             return
             
         # Add data series for each governor
         colors = ['#4472C4', '#ED7D31', '#A5A5A5', '#FFC000', '#5B9BD5', '#70AD47']
         governors = df['name'].unique()
+        col_idx = {col: i for i, col in enumerate(df.columns)}
+        scan_date_idx = col_idx['scan_date']
+        power_idx = col_idx['power']
+        sheet_name = worksheet.name
         
-        for idx, (gov, color) in enumerate(zip(governors, colors)):
+        for gov, color in zip(governors, colors):
             gov_data = df[df['name'] == gov]
-            if not gov_data.empty:
+            if len(gov_data) >= 2:
+                nrows = len(gov_data)
                 chart.add_series({
                     'name': gov,
-                    'categories': [worksheet.name, 1, df.columns.get_loc('scan_date'), 
-                                len(gov_data), df.columns.get_loc('scan_date')],
-                    'values': [worksheet.name, 1, df.columns.get_loc('power'), 
-                            len(gov_data), df.columns.get_loc('power')],
+                    'categories': [sheet_name, 1, scan_date_idx, nrows, scan_date_idx],
+                    'values': [sheet_name, 1, power_idx, nrows, power_idx],
                     'line': {'color': color, 'width': 2}
                 })
         
@@ -0,0 +1,76 @@
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+try:
+    # Optional rust_xlsxwriter bindings, not part of the default requirements
+    import pyaccelsx
+except ImportError:
+    pyaccelsx = None
+
+
+def fast_backend_available() -> bool:
+    return pyaccelsx is not None
+
+
+def _cell_value(value):
+    """Convert a DataFrame value into something the rust writer accepts"""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    return value
+
+
+def _write_dataframe_fast(workbook, sheet_name: str, df: pd.DataFrame,
+                          header_format, cell_format, date_format=None) -> None:
+    """Write pandas DataFrame to a new worksheet of a pyaccelsx workbook"""
+    workbook.add_worksheet(sheet_name)
+
+    for col_num, value in enumerate(df.columns):
+        workbook.write(0, col_num, str(value), format_option=header_format)
+        max_length = max(df[value].astype(str).str.len().max(), len(str(value))) + 2
+        workbook.set_column_width(col_num, min(max_length, 50))
+
+    column_formats = [
+        date_format if 'date' in col.lower() and date_format is not None else cell_format
+        for col in df.columns
+    ]
+    for row, row_values in enumerate(df.itertuples(index=False, name=None), start=1):
+        for col_num, value in enumerate(row_values):
+            workbook.write(row, col_num, _cell_value(value), format_option=column_formats[col_num])
+
+    workbook.freeze_panes(1, 0)
+
+
+def export_kingdom_report_fast(filename: Path, df_trends: pd.DataFrame,
+                               df_alliances: pd.DataFrame,
+                               df_summary: Optional[pd.DataFrame]) -> Path:
+    """Writes the kingdom report with pyaccelsx, the trends chart sheet is not included"""
+    if pyaccelsx is None:
+        raise RuntimeError("pyaccelsx is not installed")
+
+    workbook = pyaccelsx.ExcelWorkbook()
+
+    # Formats are created once and reused for every cell
+    header_format = pyaccelsx.ExcelFormat(
+        bold=True, align='center', border=True, bg_color='4472C4', font_color='FFFFFF'
+    )
+    cell_format = pyaccelsx.ExcelFormat(align='right', border=True)
+    date_format = pyaccelsx.ExcelFormat(align='center', border=True)
+
+    if not df_trends.empty:
+        _write_dataframe_fast(workbook, 'Kingdom Trends', df_trends, header_format, cell_format, date_format)
+
+    if not df_alliances.empty:
+        _write_dataframe_fast(workbook, 'Alliance Statistics', df_alliances, header_format, cell_format)
+
+    if df_summary is not None:
+        _write_dataframe_fast(workbook, 'Kingdom Summary', df_summary, header_format, cell_format)
+
+    workbook.save(str(filename))
+    return filename
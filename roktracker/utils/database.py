@@ -1,22 +1,66 @@
 import sqlite3
+import threading
+import numpy as np
 import pandas as pd
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
+def _numeric_expr(column: str) -> str:
+    """A governor_data column as a number, scanner placeholders like "Skipped" become NULL"""
+    return f"CASE WHEN typeof(g.{column}) IN ('integer', 'real') THEN g.{column} END"
+
+
+def _numeric(column: str) -> str:
+    return f"{_numeric_expr(column)} AS {column}"
+
+
+def _to_sql_integer(series: pd.Series) -> pd.Series:
+    """Mimic CAST(... AS INTEGER) on an aggregate, truncating and keeping NULLs as NaN"""
+    series = np.trunc(series.astype(np.float64))
+    return series.astype(np.int64) if not series.isna().any() else series
+
+
 class HistoricalDatabase:
     def __init__(self, db_path="historical_data.db"):
         self.db_path = Path(db_path)
         # Ensure parent directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Bumped on every write so readers can invalidate cached query results
+        self.revision = 0
+        # One write connection for the lifetime of the object, used by the scanner
+        # thread under a lock. Reads go through a per-thread connection, see _conn
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        self._local = threading.local()
         self._init_db()
 
+    def _conn(self):
+        """Read connection of the calling thread, WAL lets these read while a scan is writing"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA cache_size = -65536")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            self._local.conn = conn
+        return conn
+
     def _init_db(self):
         """Initialize database with required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock:
+                conn = self.conn
                 # Enable foreign key support
                 conn.execute("PRAGMA foreign_keys = ON")
+
+                # WAL lets the UI read while a scan is writing, the rest keeps hot pages in memory
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
+                conn.execute("PRAGMA cache_size = -65536")
+                conn.execute("PRAGMA temp_store = MEMORY")
+                conn.execute("PRAGMA mmap_size = 268435456")
                 
                 # Create scans table
                 conn.execute("""
@@ -51,38 +95,47 @@ class HistoricalDatabase:
                 # Create indices for better query performance
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_scan_date ON scans(scan_date)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_governor_scan ON governor_data(scan_id, governor_id)")
-                
-                conn.commit()
+                # Governor history looks rows up by governor first
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_gov_id ON governor_data(governor_id, scan_id)")
         except sqlite3.Error as e:
             raise RuntimeError(f"Failed to initialize database: {str(e)}")
 
+    def _rows_for(self, scan_id, governors_data):
+        """Build governor_data insert tuples for a scan"""
+        return [
+            (
+                scan_id, gov.id, gov.name, gov.power, gov.killpoints,
+                gov.t1_kills, gov.t2_kills, gov.t3_kills, gov.t4_kills,
+                gov.t5_kills, gov.dead, gov.alliance
+            )
+            for gov in governors_data
+        ]
+
     def save_scan_data(self, scan_id, scan_name, governors_data):
         """Save scan data with proper handling of UNIQUE constraint"""
-        with sqlite3.connect(self.db_path) as conn:
+        gov_data = self._rows_for(scan_id, governors_data)
+        # Stored as ISO-8601 text, which sorts and compares correctly as a string.
+        # Same text the old sqlite3 datetime adapter wrote, microseconds included
+        now_str = datetime.now().isoformat(sep=' ')
+
+        # The connection is in autocommit mode, open the transaction explicitly.
+        # Leaving the connection context commits, or rolls back on an exception.
+        with self._lock, self.conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
             try:
                 # First try to insert scan metadata
                 conn.execute(
                     "INSERT INTO scans (scan_id, scan_date, scan_name, total_governors) VALUES (?, ?, ?, ?)",
-                    (scan_id, datetime.now(), scan_name, len(governors_data))
+                    (scan_id, now_str, scan_name, len(governors_data))
                 )
                 
                 # Save governor data
-                gov_data = []
-                for gov in governors_data:
-                    gov_data.append((
-                        scan_id, gov.id, gov.name, gov.power, gov.killpoints,
-                        gov.t1_kills, gov.t2_kills, gov.t3_kills, gov.t4_kills,
-                        gov.t5_kills, gov.dead, gov.alliance
-                    ))
-                
                 conn.executemany("""
                     INSERT INTO governor_data 
                     (scan_id, governor_id, name, power, killpoints, t1_kills, t2_kills, 
                      t3_kills, t4_kills, t5_kills, dead, alliance)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, gov_data)
-                
-                conn.commit()
             
             except sqlite3.IntegrityError as e:
                 if "UNIQUE constraint failed: scans.scan_id" in str(e):
@@ -91,64 +144,80 @@ class HistoricalDatabase:
                         UPDATE scans 
                         SET scan_date = ?, scan_name = ?, total_governors = total_governors + ?
                         WHERE scan_id = ?
-                    """, (datetime.now(), scan_name, len(governors_data), scan_id))
+                    """, (now_str, scan_name, len(governors_data), scan_id))
                     
                     # Insert new governor data (existing governors will be preserved)
-                    for gov in governors_data:
-                        try:
-                            conn.execute("""
-                                INSERT INTO governor_data 
-                                (scan_id, governor_id, name, power, killpoints, t1_kills, t2_kills, 
-                                 t3_kills, t4_kills, t5_kills, dead, alliance)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """, (
-                                scan_id, gov.id, gov.name, gov.power, gov.killpoints,
-                                gov.t1_kills, gov.t2_kills, gov.t3_kills, gov.t4_kills,
-                                gov.t5_kills, gov.dead, gov.alliance
-                            ))
-                        except sqlite3.IntegrityError:
-                            # Skip duplicate governor entries
-                            continue
-                    
-                    conn.commit()
+                    conn.executemany("""
+                        INSERT OR IGNORE INTO governor_data
+                        (scan_id, governor_id, name, power, killpoints, t1_kills, t2_kills,
+                         t3_kills, t4_kills, t5_kills, dead, alliance)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, gov_data)
                 else:
                     raise
 
+            self.revision += 1
+
     def get_governor_history(self, governor_id):
         query = """
-            SELECT s.scan_date, g.*
+            SELECT s.scan_date, g.scan_id, g.governor_id, g.name,
+                   {}, {}, {}, {}, {}, {}, {}, {},
+                   g.alliance
             FROM governor_data g
             JOIN scans s ON g.scan_id = s.scan_id
             WHERE g.governor_id = ?
             ORDER BY s.scan_date
-        """
-        df = pd.read_sql_query(query, sqlite3.connect(self.db_path), params=(governor_id,))
-        # Ensure numeric columns have correct dtypes
-        numeric_columns = ['power', 'killpoints', 't1_kills', 't2_kills', 
-                         't3_kills', 't4_kills', 't5_kills', 'dead']
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        """.format(
+            _numeric('power'), _numeric('killpoints'), _numeric('t1_kills'), _numeric('t2_kills'),
+            _numeric('t3_kills'), _numeric('t4_kills'), _numeric('t5_kills'), _numeric('dead')
+        )
+        df = pd.read_sql_query(query, self._conn(), params=(governor_id,))
         return df
 
+    def get_governors_history(self, governor_ids):
+        """History of several governors in one query, in the order they were given and by scan date"""
+        governor_ids = list(governor_ids)
+        placeholders = ", ".join("?" * len(governor_ids))
+        query = """
+            SELECT s.scan_date, g.scan_id, g.governor_id, g.name,
+                   {}, {}, {}, {}, {}, {}, {}, {},
+                   g.alliance
+            FROM governor_data g
+            JOIN scans s ON g.scan_id = s.scan_id
+            WHERE g.governor_id IN ({})
+            ORDER BY g.governor_id, s.scan_date
+        """.format(
+            _numeric('power'), _numeric('killpoints'), _numeric('t1_kills'), _numeric('t2_kills'),
+            _numeric('t3_kills'), _numeric('t4_kills'), _numeric('t5_kills'), _numeric('dead'),
+            placeholders
+        )
+        df = pd.read_sql_query(query, self._conn(), params=governor_ids)
+
+        # Keep the caller's governor order, the stable sort keeps each history by date
+        position = {gov_id: idx for idx, gov_id in enumerate(governor_ids)}
+        order = df['governor_id'].map(position).to_numpy().argsort(kind='stable')
+        return df.iloc[order].reset_index(drop=True)
+
     def get_kingdom_trends(self, days=30):
         query = """
             SELECT 
                 s.scan_date,
-                CAST(AVG(g.power) as INTEGER) as avg_power,
-                CAST(AVG(g.killpoints) as INTEGER) as avg_killpoints,
+                CAST(AVG({power}) as INTEGER) as avg_power,
+                CAST(AVG({killpoints}) as INTEGER) as avg_killpoints,
                 COUNT(*) as active_governors,
-                CAST(SUM(g.t4_kills + g.t5_kills) as INTEGER) as total_t4t5_kills
+                CAST(SUM({t4_kills} + {t5_kills}) as INTEGER) as total_t4t5_kills
             FROM governor_data g
             JOIN scans s ON g.scan_id = s.scan_id
-            WHERE s.scan_date >= date('now', ?)
+            WHERE s.scan_date >= ?
             GROUP BY s.scan_id
             ORDER BY s.scan_date
-        """
-        df = pd.read_sql_query(query, sqlite3.connect(self.db_path), params=(f'-{days} days',))
-        # Ensure numeric columns have correct dtypes
-        numeric_columns = ['avg_power', 'avg_killpoints', 'active_governors', 'total_t4t5_kills']
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        """.format(
+            power=_numeric_expr('power'), killpoints=_numeric_expr('killpoints'),
+            t4_kills=_numeric_expr('t4_kills'), t5_kills=_numeric_expr('t5_kills')
+        )
+        # Compare against a bound date string so idx_scan_date can be used for the range
+        since = (datetime.now() - timedelta(days=days)).date().isoformat()
+        df = pd.read_sql_query(query, self._conn(), params=(since,))
         return df
 
     def get_top_governors(self, metric='power', limit=10):
@@ -157,18 +226,18 @@ class HistoricalDatabase:
                 SELECT scan_id FROM scans 
                 ORDER BY scan_date DESC LIMIT 1
             )
-            SELECT g.governor_id, g.name, g.power, g.killpoints, g.alliance,
-                   g.t4_kills, g.t5_kills, g.dead
+            SELECT g.governor_id, g.name, {}, {}, g.alliance,
+                   {}, {}, {}
             FROM governor_data g
             JOIN latest_scan ls ON g.scan_id = ls.scan_id
             ORDER BY g.{} DESC
             LIMIT ?
-        """.format(metric)
-        df = pd.read_sql_query(query, sqlite3.connect(self.db_path), params=(limit,))
-        # Ensure numeric columns have correct dtypes
-        numeric_columns = ['power', 'killpoints', 't4_kills', 't5_kills', 'dead']
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        """.format(
+            _numeric('power'), _numeric('killpoints'),
+            _numeric('t4_kills'), _numeric('t5_kills'), _numeric('dead'),
+            metric
+        )
+        df = pd.read_sql_query(query, self._conn(), params=(limit,))
         return df
 
     def get_alliance_statistics(self):
@@ -180,19 +249,69 @@ class HistoricalDatabase:
             SELECT 
                 g.alliance,
                 COUNT(*) as members,
-                CAST(AVG(g.power) as INTEGER) as avg_power,
-                CAST(SUM(g.power) as INTEGER) as total_power,
-                CAST(AVG(g.killpoints) as INTEGER) as avg_killpoints,
-                CAST(SUM(g.t4_kills + g.t5_kills) as INTEGER) as total_t4t5_kills
+                CAST(AVG({power}) as INTEGER) as avg_power,
+                CAST(SUM({power}) as INTEGER) as total_power,
+                CAST(AVG({killpoints}) as INTEGER) as avg_killpoints,
+                CAST(SUM({t4_kills} + {t5_kills}) as INTEGER) as total_t4t5_kills
             FROM governor_data g
             JOIN latest_scan ls ON g.scan_id = ls.scan_id
             WHERE g.alliance IS NOT NULL
             GROUP BY g.alliance
             ORDER BY total_power DESC
-        """
-        df = pd.read_sql_query(query, sqlite3.connect(self.db_path))
-        # Ensure numeric columns have correct dtypes
-        numeric_columns = ['members', 'avg_power', 'total_power', 'avg_killpoints', 'total_t4t5_kills']
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        return df
\ No newline at end of file
+        """.format(
+            power=_numeric_expr('power'), killpoints=_numeric_expr('killpoints'),
+            t4_kills=_numeric_expr('t4_kills'), t5_kills=_numeric_expr('t5_kills')
+        )
+        df = pd.read_sql_query(query, self._conn())
+        return df
+
+    def get_kingdom_overview(self, days=30):
+        """Returns (kingdom trends, alliance statistics) computed from a single read of governor_data"""
+        query = """
+            WITH latest_scan AS (
+                SELECT scan_id FROM scans
+                ORDER BY scan_date DESC LIMIT 1
+            )
+            SELECT s.scan_id, s.scan_date, s.scan_id IN latest_scan AS is_latest,
+                   s.scan_date >= ? AS in_window, g.alliance,
+                   {}, {}, {}, {}
+            FROM governor_data g
+            JOIN scans s ON g.scan_id = s.scan_id
+            WHERE s.scan_date >= ? OR s.scan_id IN latest_scan
+        """.format(
+            _numeric('power'), _numeric('killpoints'), _numeric('t4_kills'), _numeric('t5_kills')
+        )
+        since = (datetime.now() - timedelta(days=days)).date().isoformat()
+        df = pd.read_sql_query(query, self._conn(), params=(since, since))
+        # Row wise like SQL, a governor missing either value does not count
+        df['t4t5_kills'] = df['t4_kills'] + df['t5_kills']
+
+        window = df[df['in_window'] == 1]
+        trends = window.groupby('scan_id', sort=False).agg(
+            scan_date=('scan_date', 'first'),
+            avg_power=('power', 'mean'),
+            avg_killpoints=('killpoints', 'mean'),
+            active_governors=('scan_id', 'size'),
+            total_t4t5_kills=('t4t5_kills', lambda x: x.sum(min_count=1)),
+        )
+        trends = trends.sort_values('scan_date', kind='stable').reset_index(drop=True)
+
+        latest = df[(df['is_latest'] == 1) & df['alliance'].notna()]
+        alliances = latest.groupby('alliance', sort=False).agg(
+            members=('alliance', 'size'),
+            avg_power=('power', 'mean'),
+            total_power=('power', lambda x: x.sum(min_count=1)),
+            avg_killpoints=('killpoints', 'mean'),
+            total_t4t5_kills=('t4t5_kills', lambda x: x.sum(min_count=1)),
+        )
+        alliances = alliances.sort_values('total_power', ascending=False, na_position='last', kind='stable')
+        alliances = alliances.reset_index()
+
+        for frame, columns in (
+            (trends, ['avg_power', 'avg_killpoints', 'total_t4t5_kills']),
+            (alliances, ['avg_power', 'total_power', 'avg_killpoints', 'total_t4t5_kills']),
+        ):
+            for col in columns:
+                frame[col] = _to_sql_integer(frame[col])
+
+        return trends, alliances
@@ -1,3 +1,7 @@
+from types import MappingProxyType
+
+import numpy as np
+
 # format: (x, y, width, height)
 ocr_regions = {
     # first screen
@@ -47,3 +51,19 @@ tap_positions = {
     "id_input_field": (405, 140),
     "search_button": (1342, 142),
 }
+
+# Contiguous copy of the ocr regions, one (x, y, width, height) row per name,
+# so several regions can be sliced at once without going through the dict
+ocr_region_names = tuple(ocr_regions)
+ocr_region_index = MappingProxyType({name: i for i, name in enumerate(ocr_region_names)})
+ocr_regions_arr = np.array(list(ocr_regions.values()), dtype=np.int16)
+ocr_regions_arr.setflags(write=False)
+
+# The positions are constants, expose them read only
+ocr_regions = MappingProxyType(ocr_regions)
+tap_positions = MappingProxyType(tap_positions)
+
+
+def region(name: str) -> tuple:
+    """Region (x, y, width, height) of the given name, read from the array"""
+    return tuple(ocr_regions_arr[ocr_region_index[name]].tolist())
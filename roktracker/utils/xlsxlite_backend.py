@@ -0,0 +1,46 @@
+import pandas as pd
+from pathlib import Path
+
+try:
+    # Optional streaming xlsx writer, not part of the default requirements
+    from xlsxlite.writer import XLSXBook
+except ImportError:
+    XLSXBook = None
+
+
+def xlsxlite_available() -> bool:
+    return XLSXBook is not None
+
+
+def _cell_value(value):
+    """xlsxlite only accepts str, bool, int, float and datetime cells"""
+    if value is None or value != value:
+        # None, NaN and NaT become empty cells
+        return ""
+    return value
+
+
+def _append_dataframe(book, sheet_name: str, df: pd.DataFrame) -> None:
+    """Stream a DataFrame row by row into a new sheet"""
+    sheet = book.add_sheet(sheet_name)
+    sheet.append_row(*(str(col) for col in df.columns))
+    for row in df.itertuples(index=False, name=None):
+        sheet.append_row(*(_cell_value(value) for value in row))
+
+
+def export_governor_report_xlsxlite(filename: Path, df_history: pd.DataFrame,
+                                    df_predictions: pd.DataFrame | None) -> Path:
+    """Writes the governor report through temporary sheet files, without charts or formatting"""
+    if XLSXBook is None:
+        raise RuntimeError("xlsxlite is not installed")
+
+    book = XLSXBook()
+
+    if not df_history.empty:
+        _append_dataframe(book, 'Governor History', df_history)
+
+    if df_predictions is not None:
+        _append_dataframe(book, 'Growth Predictions', df_predictions)
+
+    book.finalize(to_file=str(filename))
+    return filename
@@ -21,13 +21,16 @@ import signal
 import sys
 
 
-from roktracker.alliance.batch_printer import print_batch
-from roktracker.seed.scanner import SeedScanner
 from roktracker.utils.adb import *
 from roktracker.utils.console import console
 from roktracker.utils.general import *
 from roktracker.utils.ocr import get_supported_langs
 from roktracker.utils.validator import sanitize_scanname, validate_installation
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # The scanner pulls in OpenCV and tesseract, it is imported in main() when needed
+    from roktracker.seed.scanner import SeedScanner
 
 
 logger = logging.getLogger(__name__)
@@ -50,7 +53,7 @@ def handle_exception(exc_type, exc_value, exc_traceback):
 sys.excepthook = handle_exception
 
 
-def ask_abort(seed_scanner: SeedScanner) -> None:
+def ask_abort(seed_scanner: "SeedScanner") -> None:
     stop = questionary.confirm(
         message="Do you want to stop the scanner?:", auto_enter=False, default=False
     ).ask()
@@ -70,9 +73,10 @@ def load_scan_configuration(config: dict) -> dict:
         default=config["general"]["bluestacks"]["name"]
     ).unsafe_ask()
     
+    detected_port = get_bluestacks_port(scan_config['bluestacks_name'], config)
     scan_config['port'] = int(questionary.text(
-        f"Adb port of device (detected {get_bluestacks_port(scan_config['bluestacks_name'], config)}):",
-        default=str(get_bluestacks_port(scan_config['bluestacks_name'], config)),
+        f"Adb port of device (detected {detected_port}):",
+        default=str(detected_port),
         validate=lambda port: is_string_int(port)
     ).unsafe_ask())
     
@@ -97,7 +101,7 @@ def load_scan_configuration(config: dict) -> dict:
 
     return scan_config
 
-def safe_scan_execution(seed_scanner: SeedScanner, **scan_params) -> None:
+def safe_scan_execution(seed_scanner: "SeedScanner", **scan_params) -> None:
     """Execute scan with proper error handling."""
     try:
         seed_scanner.start_scan(**scan_params)
@@ -167,6 +171,9 @@ def main():
     
     save_formats.from_list(save_formats_tmp)
 
+    from roktracker.alliance.batch_printer import print_batch
+    from roktracker.seed.scanner import SeedScanner
+
     try:
         logger.info("Initializing SeedScanner")
         seed_scanner = SeedScanner(scan_config['port'], config)
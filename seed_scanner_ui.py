@@ -1,11 +1,11 @@
 import logging
 import datetime
+import functools
 import sys
 import threading
 from dummy_root import get_app_root
 from roktracker.alliance.additional_data import AdditionalData
 from roktracker.alliance.governor_data import GovernorData
-from roktracker.seed.scanner import SeedScanner
 from roktracker.utils.check_python import check_py_version
 from roktracker.utils.exception_handling import GuiExceptionHandler
 from roktracker.utils.exceptions import AdbError, ConfigError
@@ -13,11 +13,11 @@ from roktracker.utils.general import is_string_int, load_config
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton, 
-    QProgressBar, QFrame, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QCheckBox, QTabWidget, QGridLayout, QMessageBox, QGroupBox,
-    QSpacerItem, QSizePolicy, QSystemTrayIcon
+    QProgressBar, QFrame, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit,
+    QCheckBox, QGridLayout, QMessageBox, QGroupBox,
+    QSizePolicy, QSystemTrayIcon
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QMutex, QMutexLocker
+from PyQt6.QtCore import Qt, QLocale, QObject, QThread, pyqtSignal, QTimer
 from PyQt6.QtGui import QIntValidator, QIcon
 
 logging.basicConfig(
@@ -31,10 +31,14 @@ logging.basicConfig(
 check_py_version((3, 11))
 
 from dummy_root import get_app_root
-from roktracker.utils.validator import sanitize_scanname, validate_installation
+from roktracker.utils.validator import SanitizationResult, sanitize_scanname, validate_installation
 from roktracker.utils.adb import get_bluestacks_port
-from threading import ExceptHookArgs, Thread
-from typing import Dict, List
+from threading import ExceptHookArgs
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    # The scanner pulls in OpenCV and tesseract, it is imported once a scan starts
+    from roktracker.seed.scanner import SeedScanner
 
 logger = logging.getLogger(__name__)
 ex_handler = GuiExceptionHandler(logger)
@@ -43,16 +47,36 @@ sys.excepthook = ex_handler.handle_exception
 threading.excepthook = ex_handler.handle_thread_exception
 
 def to_int_or(element, alternative):
+    if isinstance(element, int):
+        return element
+
     if element == "Skipped":
         return element
 
-    try:
-        return int(element)
-    except ValueError:
-        return alternative
+    # Check the digits up front instead of raising ValueError for unreadable scores
+    if isinstance(element, str):
+        digits = element[1:] if element.startswith("-") else element
+        if digits.isdecimal():
+            return int(element)
+
+    return alternative
 
 from typing import List, Dict, Any, TypedDict
 
+
+@functools.lru_cache(maxsize=64)
+def _sanitize_cached(name: str) -> SanitizationResult:
+    """Repeated start clicks with the same scan name skip the pathvalidate checks"""
+    return sanitize_scanname(name)
+
+
+# Created on first use, once the QApplication exists
+@functools.lru_cache(maxsize=None)
+def _int_validator(bottom: int, top: int) -> QIntValidator:
+    """Shared validator for a range, they hold no per-widget state"""
+    return QIntValidator(bottom, top)
+
+
 class CheckboxValue(TypedDict):
     name: str
     default: bool
@@ -62,29 +86,38 @@ class CheckboxFrame(QFrame):
     def __init__(self, parent, values: List[CheckboxValue], groupName: str):
         super().__init__(parent)
         self.values = [x for x in values if x["group"] == groupName]
-        self.checkboxes: List[QCheckBox] = []
+        self.checkbox_map: Dict[str, QCheckBox] = {}
+        # Result of get(), dropped whenever a checkbox changes
+        self._cached: Dict[str, bool] | None = None
         layout = QVBoxLayout(self)
         
         for value in self.values:
             checkbox = QCheckBox(value["name"])
             if value["default"]:
                 checkbox.setChecked(True)
+            checkbox.stateChanged.connect(self._invalidate)
             layout.addWidget(checkbox)
-            self.checkboxes.append(checkbox)
+            self.checkbox_map[value["name"]] = checkbox
         
         self.setLayout(layout)
 
+    def _invalidate(self):
+        self._cached = None
+
     def get(self) -> Dict[str, bool]:
-        values = {}
-        for checkbox in self.checkboxes:
-            values.update({checkbox.text(): checkbox.isChecked()})
-        return values
+        if self._cached is None:
+            self._cached = {name: cb.isChecked() for name, cb in self.checkbox_map.items()}
+        # Callers get a copy so they cannot change the cached result
+        return dict(self._cached)
 
 class HorizontalCheckboxFrame(QFrame):
     def __init__(self, parent, values: List[CheckboxValue], groupName: str, options_per_row: int):
         super().__init__(parent)
         self.values = [x for x in values if x["group"] == groupName]
-        self.checkboxes: List[Dict[str, QCheckBox]] = []
+        self.names: List[str] = []
+        self.boxes: List[QCheckBox] = []
+        # Result of get(), dropped whenever a checkbox changes
+        self._cached: Dict[str, bool] | None = None
         
         layout = QGridLayout(self)
         
@@ -98,27 +131,41 @@ class HorizontalCheckboxFrame(QFrame):
             checkbox = QCheckBox()
             if value["default"]:
                 checkbox.setChecked(True)
+            checkbox.stateChanged.connect(self._invalidate)
             layout.addWidget(checkbox, row + 1, col)
             
-            self.checkboxes.append({value["name"]: checkbox})
+            self.names.append(value["name"])
+            self.boxes.append(checkbox)
         
         self.setLayout(layout)
 
+    def _invalidate(self):
+        self._cached = None
+
     def get(self) -> Dict[str, bool]:
-        values = {}
-        for checkbox in self.checkboxes:
-            for k, v in checkbox.items():
-                values.update({k: bool(v.isChecked())})
-        return values
+        if self._cached is None:
+            self._cached = {name: box.isChecked() for name, box in zip(self.names, self.boxes)}
+        # Callers get a copy so they cannot change the cached result
+        return dict(self._cached)
 
 
 class BasicOptionsFame(QFrame):
     def __init__(self, parent, config):
         super().__init__(parent)
         self.config = config
+        # Resolving a port reads the BlueStacks config file, only do that once per instance name
+        self._port_for = functools.lru_cache(maxsize=32)(
+            lambda name: get_bluestacks_port(name, self.config)
+        )
+
+        # textChanged fires on every keystroke, look the port up once typing pauses
+        self._port_debounce = QTimer(self)
+        self._port_debounce.setSingleShot(True)
+        self._port_debounce.setInterval(250)
+        self._port_debounce.timeout.connect(self._do_update_port)
 
-        self.port_validator = QIntValidator(1024, 65535)
-        self.amount_validator = QIntValidator(1, 10000)
+        self.port_validator = _int_validator(1024, 65535)
+        self.amount_validator = _int_validator(1, 10000)
 
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(15)
@@ -159,7 +206,8 @@ class BasicOptionsFame(QFrame):
         connection_layout.addWidget(self.bluestacks_instance_label, 0, 0)
         self.bluestacks_instance_text = QLineEdit()
         self.bluestacks_instance_text.setText(config["general"]["bluestacks"]["name"])
-        self.bluestacks_instance_text.textChanged.connect(self.update_port)
+        self.bluestacks_instance_text.textChanged.connect(lambda _: self._port_debounce.start())
+        self.bluestacks_instance_text.editingFinished.connect(self._refresh_port)
         connection_layout.addWidget(self.bluestacks_instance_text, 0, 1)
 
         self.adb_port_label = QLabel("Adb port:")
@@ -167,7 +215,14 @@ class BasicOptionsFame(QFrame):
         self.adb_port_text = QLineEdit()
         self.adb_port_text.setValidator(self.port_validator)
         connection_layout.addWidget(self.adb_port_text, 1, 1)
-        self.update_port()
+
+        # Lookup errors are shown inline, a dialog would interrupt typing
+        self.port_status_label = QLabel("")
+        self.port_status_label.setStyleSheet("color: red;")
+        self.port_status_label.setWordWrap(True)
+        self.port_status_label.setVisible(False)
+        connection_layout.addWidget(self.port_status_label, 2, 0, 1, 2)
+        self._do_update_port()
 
         main_layout.addWidget(connection_group)
 
@@ -194,6 +249,11 @@ class BasicOptionsFame(QFrame):
         ]
         self.output_options = HorizontalCheckboxFrame(self, output_values, "Output Format", 3)
         output_layout.addWidget(self.output_options)
+        # Rebuilt only after a format checkbox changed. A running scan keeps the
+        # instance it was started with, so it is never modified in place
+        self._formats: OutputFormats | None = None
+        for checkbox in self.output_options.boxes:
+            checkbox.stateChanged.connect(self._invalidate_formats)
 
         main_layout.addWidget(output_group)
         
@@ -203,26 +263,43 @@ class BasicOptionsFame(QFrame):
         self.scan_uuid_var = uuid
         self.scan_uuid_label_2.setText(uuid)
 
-    def update_port(self, name=""):
+    def _do_update_port(self):
         """Update port text field with Bluestacks port"""
         self.adb_port_text.clear()
         try:
-            port = get_bluestacks_port(
-                name if name else self.bluestacks_instance_text.text(), 
-                self.config
-            )
+            port = self._port_for(self.bluestacks_instance_text.text())
             self.adb_port_text.setText(str(port))
+            self.port_status_label.clear()
+            self.port_status_label.setVisible(False)
         except Exception as e:
             logger.error(f"Failed to get Bluestacks port: {e}")
-            QMessageBox.warning(
-                self,
-                "Port Error",
-                f"Failed to get Bluestacks port: {e}")
+            self.port_status_label.setText(f"Failed to get Bluestacks port: {e}")
+            self.port_status_label.setVisible(True)
+            # Look the ports up again once the instance has been fixed
+            self._port_for.cache_clear()
         return True
 
+    def _refresh_port(self):
+        """Look the port up again after the user edited the instance name"""
+        if not self.bluestacks_instance_text.isModified():
+            return
+        self.bluestacks_instance_text.setModified(False)
+        self._port_debounce.stop()
+        # The instance may have been reconfigured or restarted since it was cached
+        self._port_for.cache_clear()
+        self._do_update_port()
+
+    def _invalidate_formats(self):
+        self._formats = None
+
+    def get_formats(self) -> "OutputFormats":
+        if self._formats is None:
+            self._formats = OutputFormats()
+            self._formats.from_dict(self.output_options.get())
+        return self._formats
+
     def get_options(self):
-        formats = OutputFormats()
-        formats.from_dict(self.output_options.get())
+        formats = self.get_formats()
         return {
             "uuid": self.scan_uuid_var,
             "name": self.scan_name_text.text(),
@@ -248,7 +325,7 @@ class BasicOptionsFame(QFrame):
         except ValueError:
             val_errors.append("People to scan must be a valid number")
 
-        if all(value == False for value in self.output_options.get().values()):
+        if not any(self.output_options.get().values()):
             val_errors.append("No output format checked")
 
         if len(val_errors) > 0:
@@ -259,7 +336,7 @@ class BasicOptionsFame(QFrame):
             )
             return False
 
-        name_validation = sanitize_scanname(self.scan_name_text.text())
+        name_validation = _sanitize_cached(self.scan_name_text.text())
         if not name_validation.valid:
             QMessageBox.warning(
                 self,
@@ -277,16 +354,16 @@ class BasicOptionsFame(QFrame):
 class AdditionalStatusInfo(QFrame):
     def __init__(self, parent):
         super().__init__(parent)
-        self.values: Dict[str, QLabel] = {}
         layout = QGridLayout(self)
         self.setLayout(layout)
 
         self.gov_number_var = QLabel("24 to 30 of 30")
-        self.values.update({"govs": self.gov_number_var})
         self.approx_time_remaining_var = QLabel("0:16:34")
-        self.values.update({"eta": self.approx_time_remaining_var})
         self.last_time_var = QLabel("13:55:30")
-        self.values.update({"time": self.last_time_var})
+        # Last text written per label, unchanged values skip the setText call
+        self._last_govs = self.gov_number_var.text()
+        self._last_eta = self.approx_time_remaining_var.text()
+        self._last_time = self.last_time_var.text()
 
         layout.addWidget(QLabel("Current time"), 0, 0)
         layout.addWidget(self.last_time_var, 1, 0)
@@ -296,12 +373,25 @@ class AdditionalStatusInfo(QFrame):
 
         layout.addWidget(self.gov_number_var, 0, 1)
 
-    def set_var(self, key, value):
-        if key in self.values:
-            self.values[key].setText(value)
+    def set_govs(self, text: str):
+        if text != self._last_govs:
+            self.gov_number_var.setText(text)
+            self._last_govs = text
+
+    def set_eta(self, text: str):
+        if text != self._last_eta:
+            self.approx_time_remaining_var.setText(text)
+            self._last_eta = text
+
+    def set_time(self, text: str):
+        if text != self._last_time:
+            self.last_time_var.setText(text)
+            self._last_time = text
 
 
 class LastBatchInfo(QFrame):
+    GOV_RANGE_TEMPLATE = "%d to %d of %d"
+
     def __init__(self, parent, govs_per_batch):
         super().__init__(parent)
         main_layout = QVBoxLayout(self)
@@ -318,91 +408,245 @@ class LastBatchInfo(QFrame):
         main_layout.addWidget(status_group)
 
         govs_group = QGroupBox("Current Batch")
-        govs_layout = QVBoxLayout()
-        govs_layout.setSpacing(8)
+        govs_layout = QFormLayout()
+        govs_layout.setVerticalSpacing(8)
+        govs_layout.setHorizontalSpacing(10)
         govs_group.setLayout(govs_layout)
 
-        self.entries: List[QLabel] = []
-        self.labels: List[QLabel] = []
-        self.variables: Dict[str, QLabel] = {}
+        self.name_labels: List[QLabel] = []
+        self.score_labels: List[QLabel] = []
+        # Last text written per row, unchanged values skip the setText call
+        self._last_names: List[str | None] = [None] * govs_per_batch
+        self._last_scores: List[int | str | None] = [None] * govs_per_batch
+        # Fixed locale so scores keep the same comma grouping on every system
+        self._locale = QLocale(QLocale.Language.English, QLocale.Country.UnitedStates)
 
         for i in range(0, govs_per_batch):
-            row_widget = QWidget()
-            row_layout = QHBoxLayout()
-            row_layout.setSpacing(10)
-            row_widget.setLayout(row_layout)
-
             label = QLabel()
             entry = QLabel()
             
             label.setMinimumWidth(150)
             entry.setMinimumWidth(80)
             
-            row_layout.addWidget(label)
-            row_layout.addWidget(entry)
-            row_layout.addStretch()
+            govs_layout.addRow(label, entry)
 
-            govs_layout.addWidget(row_widget)
-
-            self.variables.update({f"name-{i}": label})
-            self.variables.update({f"score-{i}": entry})
-            self.labels.append(label)
-            self.entries.append(entry)
+            self.name_labels.append(label)
+            self.score_labels.append(entry)
 
         main_layout.addWidget(govs_group)
         main_layout.addStretch()
 
-    def set(self, values):
-        for key, value in values.items():
-            if key in self.variables:
-                if isinstance(value, int):
-                    self.variables[key].setText(f"{value:,}")
-                else:
-                    self.variables[key].setText(value)
-            else:
-                self.additional_stats.set_var(key, value)
+    def set_governor(self, index: int, name: str, score: int | str):
+        if self._last_names[index] != name:
+            self.name_labels[index].setText(name)
+            self._last_names[index] = name
+
+        # Compare the raw score so an unchanged value is not formatted again
+        if self._last_scores[index] != score:
+            text = self._locale.toString(score) if isinstance(score, int) else score
+            self.score_labels[index].setText(text)
+            self._last_scores[index] = score
+
+    def update_batch(self, gov_data: List[GovernorData], extra_data: AdditionalData):
+        # Hold painting until every label of the batch is set, re-enabling repaints once
+        self.setUpdatesEnabled(False)
+        try:
+            for index, gov in enumerate(gov_data):
+                self.set_governor(index, gov.name, to_int_or(gov.score, "Unknown"))
+
+            page = extra_data.current_page
+            per_page = extra_data.govs_per_page
+            self.additional_stats.set_govs(
+                self.GOV_RANGE_TEMPLATE % (page * per_page, (page + 1) * per_page, extra_data.target_governor)
+            )
+            self.additional_stats.set_time(extra_data.current_time)
+            self.additional_stats.set_eta(extra_data.eta())
+        finally:
+            self.setUpdatesEnabled(True)
+
+
+class ScannerWorker(QObject):
+    """Runs a seed scan on its own QThread and reports back through signals"""
+    progress = pyqtSignal(dict)
+    state = pyqtSignal(str)
+    run_id = pyqtSignal(str)
+    done = pyqtSignal(dict)
+
+    def __init__(self, config, options):
+        super().__init__()
+        self.config = config
+        self.options = options
+        self.seed_scanner: "SeedScanner | None" = None
+        self._total_pages: int | None = None
+        self._last_progress = -1
+        self._last_state: str | None = None
+
+    def end_scan(self):
+        if self.seed_scanner:
+            self.seed_scanner.end_scan()
+
+    def run(self):
+        options = self.options
+        result: Dict[str, Any] = {}
+
+        try:
+            from roktracker.seed.scanner import SeedScanner
+
+            self.seed_scanner = SeedScanner(options["port"], self.config)
+            self.seed_scanner.set_batch_callback(self.governor_callback)
+            self.seed_scanner.set_state_callback(self.state_callback)
+            self.run_id.emit(self.seed_scanner.run_id)
+
+            logger.info(f"Scan started at {datetime.datetime.now()}")
+            self.seed_scanner.start_scan(
+                options["name"],
+                options["amount"],
+                options["formats"]
+            )
+
+        except AdbError as error:
+            logger.error(f"ADB connection error at {datetime.datetime.now()}: {error}")
+            error_msg = (
+                "Failed to connect to BlueStacks via ADB. Please follow these troubleshooting steps:\n\n"
+                "1. Verify BlueStacks:\n"
+                "   - Check that BlueStacks is running\n"
+                "   - Confirm the instance name matches exactly: '{name}'\n"
+                "   - Try restarting BlueStacks\n\n"
+                "2. Check ADB Connection:\n"
+                "   - Verify ADB port {port} matches your BlueStacks instance\n"
+                "   - Run 'adb devices' to check connected devices\n"
+                "   - Try 'adb kill-server' followed by 'adb start-server'\n\n"
+                "3. Network/Firewall:\n"
+                "   - Check if firewall is blocking ADB connections\n"
+                "   - Ensure no other program is using port {port}\n\n"
+                "4. Game State:\n"
+                "   - Verify you're logged into Rise of Kingdoms\n"
+                "   - Ensure you have access to the Seed Store screen\n"
+                "   - Verify your civilization has access to seed features\n"
+                "   - Check your internet connection\n\n"
+                "5. Tools/Environment:\n"
+                "   - Verify platform-tools (adb.exe) exists in deps folder\n"
+                "   - Check if running as administrator helps\n\n"
+                "Error details: {error}"
+            ).format(name=options.get("name", ""), port=options["port"], error=str(error))
+            result = {
+                "error": "ADB Connection Error",
+                "message": error_msg
+            }
+            self.state_callback("Not started - ADB Error")
+
+        except ConfigError as error:
+            logger.error(f"Configuration error at {datetime.datetime.now()}: {error}")
+            error_msg = (
+                "Configuration error detected. Please check the following:\n\n"
+                "1. Config File:\n"
+                "   - Verify config.json exists in the application root\n"
+                "   - Check file permissions (read/write access)\n"
+                "   - Validate JSON syntax is correct\n\n"
+                "2. Required Settings:\n"
+                "   - Confirm all required settings are present\n"
+                "   - Check paths for seed scanner are configured\n"
+                "   - Verify BlueStacks configuration is correct\n\n"
+                "3. File Structure:\n"
+                "   - Check if all required folders exist (deps, tessdata)\n"
+                "   - Verify no required files are missing\n\n"
+                "4. Workspace:\n"
+                "   - Ensure working directory is writable\n"
+                "   - Check if log files can be created/written\n\n"
+                "5. Try These Steps:\n"
+                "   - Reset config.json to default values\n"
+                "   - Run application as administrator\n"
+                "   - Check seed-scanner.log for details\n\n"
+                "Error details: {error}"
+            ).format(error=str(error))
+            result = {
+                "error": "Configuration Error",
+                "message": error_msg
+            }
+            self.state_callback("Not started - Config Error")
+
+        except Exception as error:
+            logger.error(f"Unexpected error at {datetime.datetime.now()}: {error}")
+            error_msg = (
+                "An unexpected error occurred. Please try:\n\n"
+                "1. Restarting BlueStacks\n"
+                "2. Verifying you are logged into Rise of Kingdoms\n"
+                "3. Checking your internet connection\n"
+                "4. Ensuring enough disk space for screenshots\n"
+                "5. Restarting the scanner application\n"
+                "6. Verifying you have access to seed view\n\n"
+                "Error details: {error}"
+            ).format(error=str(error))
+            result = {
+                "error": "Unexpected Error",
+                "message": error_msg
+            }
+            self.state_callback("Not started - Fatal Error")
+        else:
+            logger.info(f"Scan completed at {datetime.datetime.now()}")
+            result = {
+                "success": True,
+                "message": "The scan has been completed successfully."
+            }
+        finally:
+            self.done.emit(result)
+
+    def governor_callback(self, gov_data: List[GovernorData], extra_data: AdditionalData):
+        payload: Dict[str, Any] = {"gov_data": gov_data, "extra_data": extra_data}
+
+        if self._total_pages is None:
+            # Target and page size stay the same for the whole scan
+            self._total_pages = -(-extra_data.target_governor // extra_data.govs_per_page)
+        progress = (extra_data.current_page * 100) // self._total_pages
+        # Skip the repaint when the percentage did not move
+        if progress != self._last_progress:
+            self._last_progress = progress
+            payload["progress"] = progress
+
+        # Queued to the GUI thread, the widgets are only touched in update_batch_safely
+        self.progress.emit(payload)
+
+    def state_callback(self, state):
+        if state != self._last_state:
+            self._last_state = state
+            self.state.emit(state)
 
 
 class App(QMainWindow):
-    update_ui_signal = pyqtSignal(dict)
-    
     def __init__(self):
         super().__init__()
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
         
-        self.ui_mutex = QMutex()
-        self.scanner_thread = None
-        self.seed_scanner = None
+        self.scanner_thread: QThread | None = None
+        self.scanner_worker: ScannerWorker | None = None
 
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setIcon(QIcon("images/seed.png"))
         self.tray_icon.setToolTip("Seed Scanner")
         self.tray_icon.show()
         
-        self.update_ui_signal.connect(self.update_ui_safely)
         self.setup_ui()
 
     def closeEvent(self, event):
         """Handle application closing"""
-        if self.seed_scanner:
+        if self.scanner_worker:
             try:
-                with QMutexLocker(self.ui_mutex):
-                    self.seed_scanner.end_scan()
-                    self.seed_scanner = None
-            except:
-                logger.error("Failed to cleanly stop scanner")
+                self.scanner_worker.end_scan()
+                self.scanner_worker.progress.disconnect()
+                self.scanner_worker.state.disconnect()
+                self.scanner_worker.done.disconnect(self.scan_done)
+            except Exception as e:
+                logger.error(f"Failed to cleanly stop scanner: {e}")
         
-        if self.scanner_thread and self.scanner_thread.is_alive():
+        if self.scanner_thread and self.scanner_thread.isRunning():
             try:
-                self.scanner_thread.join(timeout=2.0)
-                if self.scanner_thread.is_alive():
-                    logger.warning("Scanner thread did not terminate cleanly")
-            except:
-                logger.error("Failed to join scanner thread")
-        
-        self.scanner_thread = None
-        self.update_ui_signal.disconnect()
+                # run() blocks the thread until the scan stops, quit() only ends
+                # the event loop afterwards. Destroying a running QThread aborts.
+                self.scanner_thread.quit()
+                self.scanner_thread.wait()
+            except Exception as e:
+                logger.error(f"Failed to join scanner thread: {e}")
         
         super().closeEvent(event)
 
@@ -505,159 +749,47 @@ class App(QMainWindow):
 
     def end_scan(self):
         """Handle scan termination"""
-        with QMutexLocker(self.ui_mutex):
-            if self.seed_scanner:
-                self.seed_scanner.end_scan()
-                self.end_scan_button.setEnabled(False)
-                self.end_scan_button.setText("Abort after next governor")
+        if self.scanner_worker and self.scanner_worker.seed_scanner:
+            self.scanner_worker.end_scan()
+            self.end_scan_button.setEnabled(False)
+            self.end_scan_button.setText("Abort after next governor")
 
     def start_scan(self):
         """Start scan in a new thread"""
-        with QMutexLocker(self.ui_mutex):
-            if self.scanner_thread and self.scanner_thread.is_alive():
-                return
-                
-            self.scanner_thread = Thread(
-                target=self.launch_scanner,
-                name="ScannerThread",
-            )
-            self.scanner_thread.start()
+        if self.scanner_thread is not None:
+            return
 
-    def launch_scanner(self):
         if not self.options_frame.options_valid():
             return
 
         self.start_scan_button.setEnabled(False)
         options = self.options_frame.get_options()
 
-        try:
-            self.seed_scanner = SeedScanner(options["port"], self.config)
-            self.seed_scanner.set_batch_callback(self.governor_callback)
-            self.seed_scanner.set_state_callback(self.state_callback)
-            self.options_frame.set_uuid(self.seed_scanner.run_id)
-
-            logger.info(f"Scan started at {datetime.datetime.now()}")
-            self.seed_scanner.start_scan(
-                options["name"],
-                options["amount"],
-                options["formats"]
-            )
-
-        except AdbError as error:
-            logger.error(f"ADB connection error at {datetime.datetime.now()}: {error}")
-            error_msg = (
-                "Failed to connect to BlueStacks via ADB. Please follow these troubleshooting steps:\n\n"
-                "1. Verify BlueStacks:\n"
-                "   - Check that BlueStacks is running\n"
-                "   - Confirm the instance name matches exactly: '{name}'\n"
-                "   - Try restarting BlueStacks\n\n"
-                "2. Check ADB Connection:\n"
-                "   - Verify ADB port {port} matches your BlueStacks instance\n"
-                "   - Run 'adb devices' to check connected devices\n"
-                "   - Try 'adb kill-server' followed by 'adb start-server'\n\n"
-                "3. Network/Firewall:\n"
-                "   - Check if firewall is blocking ADB connections\n"
-                "   - Ensure no other program is using port {port}\n\n"
-                "4. Game State:\n"
-                "   - Verify you're logged into Rise of Kingdoms\n"
-                "   - Ensure you have access to the Seed Store screen\n"
-                "   - Verify your civilization has access to seed features\n"
-                "   - Check your internet connection\n\n"
-                "5. Tools/Environment:\n"
-                "   - Verify platform-tools (adb.exe) exists in deps folder\n"
-                "   - Check if running as administrator helps\n\n"
-                "Error details: {error}"
-            ).format(name=options.get("name", ""), port=options["port"], error=str(error))
-            self.update_ui_signal.emit({
-                "error": "ADB Connection Error",
-                "message": error_msg
-            })
-            self.state_callback("Not started - ADB Error")
-
-        except ConfigError as error:
-            logger.error(f"Configuration error at {datetime.datetime.now()}: {error}")
-            error_msg = (
-                "Configuration error detected. Please check the following:\n\n"
-                "1. Config File:\n"
-                "   - Verify config.json exists in the application root\n"
-                "   - Check file permissions (read/write access)\n"
-                "   - Validate JSON syntax is correct\n\n"
-                "2. Required Settings:\n"
-                "   - Confirm all required settings are present\n"
-                "   - Check paths for seed scanner are configured\n"
-                "   - Verify BlueStacks configuration is correct\n\n"
-                "3. File Structure:\n"
-                "   - Check if all required folders exist (deps, tessdata)\n"
-                "   - Verify no required files are missing\n\n"
-                "4. Workspace:\n"
-                "   - Ensure working directory is writable\n"
-                "   - Check if log files can be created/written\n\n"
-                "5. Try These Steps:\n"
-                "   - Reset config.json to default values\n"
-                "   - Run application as administrator\n"
-                "   - Check seed-scanner.log for details\n\n"
-                "Error details: {error}"
-            ).format(error=str(error))
-            self.update_ui_signal.emit({
-                "error": "Configuration Error",
-                "message": error_msg
-            })
-            self.state_callback("Not started - Config Error")
-
-        except Exception as error:
-            logger.error(f"Unexpected error at {datetime.datetime.now()}: {error}")
-            error_msg = (
-                "An unexpected error occurred. Please try:\n\n"
-                "1. Restarting BlueStacks\n"
-                "2. Verifying you are logged into Rise of Kingdoms\n" 
-                "3. Checking your internet connection\n"
-                "4. Ensuring enough disk space for screenshots\n"
-                "5. Restarting the scanner application\n"
-                "6. Verifying you have access to seed view\n\n"
-                "Error details: {error}"
-            ).format(error=str(error))
-            self.update_ui_signal.emit({
-                "error": "Unexpected Error",
-                "message": error_msg
-            })
-            self.state_callback("Not started - Fatal Error")
-        else:
-            logger.info(f"Scan completed at {datetime.datetime.now()}")
-            self.update_ui_signal.emit({
-                "success": True,
-                "message": "The scan has been completed successfully."
-            })
-        finally:
-            self.end_scan_button.setEnabled(True)
-            self.end_scan_button.setText("End Scan")
-            self.start_scan_button.setEnabled(True)
-
-    def governor_callback(self, gov_data: List[GovernorData], extra_data: AdditionalData):
-        batch_data: Dict[str, str | int] = {}
-        for index, gov in enumerate(gov_data):
-            batch_data.update({f"name-{index}": gov.name})
-            batch_data.update({f"score-{index}": to_int_or(gov.score, "Unknown")})
-
-        batch_data.update({
-            "govs": f"{extra_data.current_page * extra_data.govs_per_page} to {(extra_data.current_page + 1) * extra_data.govs_per_page} of {extra_data.target_governor}",
-            "time": extra_data.current_time,
-            "eta": extra_data.eta(),
-        })
-
-        self.update_ui_signal.emit({"batch_data": batch_data})
-        
-        total_pages = extra_data.target_governor // extra_data.govs_per_page
-        if extra_data.target_governor % extra_data.govs_per_page != 0:
-            total_pages += 1
-        self.update_ui_signal.emit({
-            "progress": {
-                "current": extra_data.current_page,
-                "total": total_pages
-            }
-        })
-
-    def state_callback(self, state):
-        self.update_ui_signal.emit({"state": state})
+        self.scanner_thread = QThread()
+        self.scanner_worker = ScannerWorker(self.config, options)
+        self.scanner_worker.moveToThread(self.scanner_thread)
+
+        self.scanner_thread.started.connect(self.scanner_worker.run)
+        self.scanner_worker.progress.connect(self.update_batch_safely)
+        self.scanner_worker.state.connect(self.current_state.setText)
+        self.scanner_worker.run_id.connect(self.options_frame.set_uuid)
+        self.scanner_worker.done.connect(self.scan_done)
+        self.scanner_worker.done.connect(self.scanner_thread.quit)
+        self.scanner_thread.finished.connect(self.scanner_worker.deleteLater)
+        self.scanner_thread.finished.connect(self.scanner_thread.deleteLater)
+        self.scanner_thread.finished.connect(self.scanner_finished)
+
+        self.scanner_thread.start()
+
+    def scan_done(self, result):
+        self.end_scan_button.setEnabled(True)
+        self.end_scan_button.setText("End Scan")
+        self.start_scan_button.setEnabled(True)
+        self.update_ui_safely(result)
+
+    def scanner_finished(self):
+        self.scanner_thread = None
+        self.scanner_worker = None
 
     def show_notification(self, title: str, message: str, icon=QSystemTrayIcon.MessageIcon.Information):
         """Show both a system notification and a message box"""
@@ -669,36 +801,35 @@ class App(QMainWindow):
             QMessageBox.information(self, title, message)
 
     def update_ui_safely(self, data):
-        """Handle UI updates in a thread-safe way"""
-        with QMutexLocker(self.ui_mutex):
-            if "error" in data:
-                self.show_notification(
-                    data["error"],
-                    data["message"],
-                    QSystemTrayIcon.MessageIcon.Critical
-                )
-            elif "success" in data:
-                self.show_notification(
-                    "Scan Complete",
-                    data["message"],
-                    QSystemTrayIcon.MessageIcon.Information
+        """Show the result of a finished scan"""
+        if "error" in data:
+            self.show_notification(
+                data["error"],
+                data["message"],
+                QSystemTrayIcon.MessageIcon.Critical
+            )
+        elif "success" in data:
+            self.show_notification(
+                "Scan Complete",
+                data["message"],
+                QSystemTrayIcon.MessageIcon.Information
+            )
+
+    def update_batch_safely(self, payload):
+        """Apply a scanned batch and its progress on the GUI thread"""
+        self.last_batch_frame.update_batch(payload["gov_data"], payload["extra_data"])
+
+        if "progress" in payload:
+            progress_value = payload["progress"]
+            self.progress_bar.setValue(progress_value)
+
+            if progress_value in [25, 50, 75, 100]:
+                self.tray_icon.showMessage(
+                    "Scan Progress",
+                    f"Seed scan is {progress_value}% complete",
+                    QSystemTrayIcon.MessageIcon.Information,
+                    3000
                 )
-            elif "batch_data" in data:
-                self.last_batch_frame.set(data["batch_data"])
-            elif "progress" in data:
-                progress = data["progress"]
-                progress_value = round((progress["current"] / progress["total"]) * 100)
-                self.progress_bar.setValue(progress_value)
-                
-                if progress_value in [25, 50, 75, 100]:
-                    self.tray_icon.showMessage(
-                        "Scan Progress",
-                        f"Seed scan is {progress_value}% complete",
-                        QSystemTrayIcon.MessageIcon.Information,
-                        3000
-                    )
-            elif "state" in data:
-                self.current_state.setText(data["state"])
 
 
 class OutputFormats:
@@ -0,0 +1,63 @@
+import sqlite3
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from roktracker.utils.analytics import KingdomAnalytics
+from roktracker.utils.database import HistoricalDatabase
+
+
+def _governor(power, killpoints):
+    """Stand-in for the scanner's GovernorData, only the attributes the database reads"""
+    return SimpleNamespace(
+        id="1001", name="Governor", power=power, killpoints=killpoints,
+        t1_kills=0, t2_kills=0, t3_kills=0, t4_kills=10, t5_kills=5, dead=1, alliance="ABC"
+    )
+
+
+def _old_format_db(path):
+    """Database written before scan_date was stored as text, through the sqlite3 datetime adapter"""
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE scans (
+            scan_id TEXT PRIMARY KEY,
+            scan_date TIMESTAMP,
+            scan_name TEXT,
+            total_governors INTEGER
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE governor_data (
+            scan_id TEXT, governor_id TEXT, name TEXT, power INTEGER, killpoints INTEGER,
+            t1_kills INTEGER, t2_kills INTEGER, t3_kills INTEGER, t4_kills INTEGER,
+            t5_kills INTEGER, dead INTEGER, alliance TEXT,
+            FOREIGN KEY(scan_id) REFERENCES scans(scan_id),
+            UNIQUE(scan_id, governor_id)
+        )
+    """)
+    start = datetime.now() - timedelta(days=5)
+    for i in range(3):
+        # The adapter leaves out the fraction when microsecond is 0
+        scan_date = (start + timedelta(days=i, microseconds=123456 * (i % 2 == 0))).isoformat(" ")
+        conn.execute("INSERT INTO scans VALUES (?, ?, ?, ?)", (f"old{i}", scan_date, "Kingdom", 1))
+        conn.execute(
+            "INSERT INTO governor_data VALUES (?, '1001', 'Governor', ?, ?, 0, 0, 0, 10, 5, 1, 'ABC')",
+            (f"old{i}", 1_000_000 * (i + 1), 500_000 * (i + 1))
+        )
+    conn.commit()
+    conn.close()
+
+
+def test_analytics_read_old_and_new_scan_dates(tmp_path):
+    path = tmp_path / "historical_data.db"
+    _old_format_db(path)
+
+    db = HistoricalDatabase(path)
+    db.save_scan_data("new0", "Kingdom", [_governor(4_000_000, 2_000_000)])
+    analytics = KingdomAnalytics(db)
+
+    summary = analytics.get_kingdom_summary()
+    assert summary['active_governors'] == 1
+
+    predictions = analytics.predict_governor_growth("1001", days_to_predict=5)
+    assert predictions is not None
+    assert len(predictions['dates']) == 5